@@ -2,8 +2,13 @@
 
 Copyright (C) Seagate Technology LLC, 2025. All rights reserved.
 """
+import contextlib
+import numpy as np
 import pandas as pd
 import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, Dict
 
@@ -15,6 +20,28 @@ class Data:
     PASS_BIN_DISK_MDWC = 'C000'
     PASS_BIN_HEAD      = 1
 
+    # `pass` disk bins either have length equal to PASS_BIN_DISK_LEN, or start with 'C000' and do
+    # not end with 3 digits.
+    PASS_BIN_DISK = re.compile(
+        rf'(?:.{{{PASS_BIN_DISK_LEN}}}\Z|(?!.*\d{{3}}\Z){re.escape(PASS_BIN_DISK_MDWC)})', re.DOTALL
+    )
+
+    # Pack csv files are named after their pack number. When ``PACK_FILE_NAME_ONLY`` is set, only
+    # csv files named like a pack number are read and their name is looked up in the pack number
+    # column, otherwise every csv file is read and all of its cells are searched for its name.
+    PACK_FILE_NAME      = re.compile(r'^\d+\.csv$')
+    PACK_FILE_NAME_ONLY = True
+
+    # Parsed csv files are kept on disk between runs, so the app only parses new or changed files
+    # on start up. The cache lives in the user's own local app data folder, as it is unpickled on
+    # load. Bump ``PACK_CACHE_VERSION`` whenever the way csv files are read changes.
+    PACK_CACHE_DIR = os.path.join(
+        os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache'),
+        'TestersTracker'
+    )
+    PACK_CACHE_FILE    = os.path.join(PACK_CACHE_DIR, 'pack_cache.pkl')
+    PACK_CACHE_VERSION = 2
+
     def __init__(self):
 
         self.n_heads = 48
@@ -32,48 +59,178 @@ class Data:
 
         self.pack_header = header + self.disks + self.heads
 
+        # Text columns are read as strings so the csv parser does not have to infer their type
+        # and disk bins stay as text even when a file only holds numeric codes. Disk bins are not
+        # narrowed to categories: each csv file holds a single pack, so per file categories cost
+        # more than the strings they replace, and every consumer needs the bin strings anyway.
+        self.pack_dtypes = {
+            col: str for col in
+            ['MX', 'end_date', 'end_time', 'profile', 'prod_id', 'production_version', 'media_from',
+             'hub_sn', 'rcc_message', 'disk_sn_out', 'disk_sn_in'] + self.disks
+        }
+
+        # Everything that decides how a csv file is parsed and unpickled. A saved cache is only
+        # reused when it was written with the same settings and pandas and numpy versions.
+        self.pack_cache_key = (
+            self.PACK_CACHE_VERSION, pd.__version__, np.__version__,
+            self.pack_header, self.pack_dtypes,
+            self.PACK_FILE_NAME.pattern, self.PACK_FILE_NAME_ONLY
+        )
+
+        # Parsed csv files from the previous call of ``getPacksData``, keyed by path, along with
+        # their modification time and size. ``None`` marks a csv file which does not hold pack data.
+        self.pack_cache: Dict[str, Tuple[Tuple[float, int], Optional[pd.DataFrame]]] = \
+            self.loadPackCache()
+
+        # Whether ``pack_cache`` changed since it was last saved.
+        self.pack_cache_changed = False
+
+    def loadPackCache(self) -> Dict[str, Tuple[Tuple[float, int], Optional[pd.DataFrame]]]:
+        """ Return the parsed csv files saved by the last run, or an empty cache if unusable."""
+        try:
+            pack_cache_key, pack_cache = pd.read_pickle(self.PACK_CACHE_FILE)
+        except Exception:
+            return {}
+
+        # Drop the cache if it was saved with different parse settings.
+        return pack_cache if pack_cache_key == self.pack_cache_key else {}
+
+    def savePackCache(self) -> None:
+        """ Save the parsed csv files for the next run if they changed since the last save."""
+        if not self.pack_cache_changed:
+            return
+
+        path_tmp = None
+        try:
+            os.makedirs(self.PACK_CACHE_DIR, exist_ok=True)
+
+            fd, path_tmp = tempfile.mkstemp(dir=self.PACK_CACHE_DIR, suffix='.tmp')
+            os.close(fd)
+
+            pd.to_pickle((self.pack_cache_key, self.pack_cache), path_tmp)
+
+            # Swap the file in one step, so a reader never sees a partly written cache.
+            os.replace(path_tmp, self.PACK_CACHE_FILE)
+
+        except OSError:
+            # The cache only speeds up the start up, the app works without it.
+            if path_tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(path_tmp)
+
+        else:
+            self.pack_cache_changed = False
+
+    def readPackFile(self, path_data: str, file: str) -> Optional[pd.DataFrame]:
+        """ Read a single csv file, return ``None`` if it does not hold the pack with its name."""
+        df_csv = pd.read_csv(
+            os.path.join(path_data, file),
+            header     = None,
+            names      = self.pack_header,
+            dtype      = self.pack_dtypes,
+            engine     = 'c',
+            low_memory = False
+        )
+
+        # Head bins are small numeric codes, store them in the smallest integer type so the cached
+        # frames stay small. Columns that are not numeric are left as they are.
+        for col in self.heads:
+            try:
+                df_csv[col] = pd.to_numeric(df_csv[col], downcast='integer')
+            except (ValueError, TypeError):
+                pass
+
+        filename = os.path.splitext(file)[0]
+
+        if self.PACK_FILE_NAME_ONLY:
+            # The file name already looks like a pack number, confirm it against the pack number
+            # column only.
+            is_pack = df_csv['pack_num'].astype(str).eq(filename).any()
+
+        else:
+            # Filter only csv file with pack number to avoid getting other csv file in the folder.
+            is_pack = np.any(df_csv.astype(str).to_numpy() == filename)
+
+        return df_csv if is_pack else None
+
     def getPacksData(self, path_data: str, n_hours: float) -> pd.DataFrame:
         """
             Get pack information from csv files under ``path_dir`` with provided the number of hours
             and join them together in DataFrame.
         """
-        packs = pd.DataFrame()
+        # Modification time and size of every csv file, keyed by its full path. A file rewritten
+        # within the timestamp resolution, or copied over with its time kept, still changes size.
+        files = {}
+        for entry in os.scandir(path_data):
+            if (entry.is_file() and entry.name.endswith('csv')
+                    and (not self.PACK_FILE_NAME_ONLY or self.PACK_FILE_NAME.match(entry.name))):
+                stat = entry.stat()
+                files[entry.path] = (stat.st_mtime, stat.st_size)
+
+        # Only read the files that are new or changed since the last call.
+        stale = [
+            path for path, file_stat in files.items()
+            if self.pack_cache.get(path, (None,))[0] != file_stat
+        ]
 
-        files = [fn for fn in os.listdir(path_data) if fn.endswith('csv')]
-        for file in files:
+        # The csv parser releases the GIL, so the files can be read in parallel threads.
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+            read_files = executor.map(
+                lambda path: self.readPackFile(path_data, os.path.basename(path)), stale
+            )
+            for path, df_csv in zip(stale, read_files):
+                self.pack_cache[path] = (files[path], df_csv)
 
-            df_csv = pd.read_csv(os.path.join(path_data, file), header=None, delim_whitespace=False)
+        # Forget the files that are no longer in the folder.
+        removed = len(self.pack_cache) != len(files)
 
-            filename = file.strip('.csv')
+        self.pack_cache = {path: self.pack_cache[path] for path in files}
 
-            # Filter only csv file with pack number to avoid getting other csv file in the folder.
-            if df_csv.apply(lambda row: filename in row.astype(str).values, axis=1).any():
+        if stale or removed:
+            self.pack_cache_changed = True
 
-                packs = pd.concat([packs, df_csv], ignore_index=True)
+        frames = [df_csv for _, df_csv in self.pack_cache.values() if df_csv is not None]
+
+        # Join all the pack frames at once rather than growing ``packs`` inside the loop.
+        packs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
         if not packs.empty:
 
-            packs.columns = self.pack_header
+            # Columns with few distinct values are stored as categories, which makes the filters
+            # and groupbys on them cheaper.
+            for col in ['tester', 'profile', 'rcc_message', 'MX']:
+                packs[col] = packs[col].astype('category')
 
-            # create a new column to combine date and time
-            packs['date_time'] = packs['end_date'] + ' ' + packs['end_time']
+            # create a new column to combine date and time. Dates and times are parsed on their own
+            # with ``cache=True`` so each distinct value is only parsed once.
+            dates = pd.to_datetime(packs['end_date'], format='%d-%b-%Y', cache=True)
+            times = pd.to_datetime(packs['end_time'], format='%H:%M', cache=True)
 
-            # convert ``date_time`` column into datatime type
-            packs['date_time'] = pd.to_datetime(packs['date_time'], format='%d-%b-%Y %H:%M')
+            packs['date_time'] = dates + (times - times.dt.normalize())
 
             filter_date = datetime.now() - timedelta(hours=n_hours)
 
             packs = packs[(packs['date_time'] >= filter_date)]
 
         else:
-            raise DataError(f'No "csv" file in {path_data}. Closing "Testers Tracker" app.')
+            raise DataError(
+                f'No pack csv file (<pack_num>.csv) in {path_data}. Closing "Testers Tracker" app.'
+            )
 
         return packs
 
-    def getBinCount(self, bins: pd.DataFrame, include_pass_bin: bool = True) -> pd.DataFrame:
+    def isPassDisk(self, bins: np.ndarray) -> np.ndarray:
+        """ Return a boolean mask of the disk bins matching the `pass` bin pattern."""
+        return pd.Series(bins, dtype=object).str.match(self.PASS_BIN_DISK, na=False).to_numpy(bool)
+
+    def isDetcrDisk(self, bins: np.ndarray) -> np.ndarray:
+        """ Return a boolean mask of the `detcr` disk bins, i.e. bins that start with 'D'."""
+        return pd.Series(bins, dtype=object).str.startswith('D', na=False).to_numpy(dtype=bool)
+
+    def getBinCount(self, bins: np.ndarray, include_pass_bin: bool = True) -> pd.DataFrame:
         """ Return the bins with their respective counts."""
         # Flatten bins to 1D array
-        bins_1d = bins.to_numpy().ravel()
+        bins_1d = np.ravel(bins)
 
         bin_count = pd.Series(bins_1d).value_counts().reset_index()
 
@@ -84,33 +241,27 @@ class Data:
         if not include_pass_bin:
 
             if bin_count['bin'].dtype == object:
-                bin_count = bin_count[
-                    ~
-                    ((bin_count['bin'].str.len() == self.PASS_BIN_DISK_LEN)
-                     | (bin_count['bin'].str.startswith(self.PASS_BIN_DISK_MDWC)
-                        & ~bin_count['bin'].str[-3:].str.isdigit())
-                     )
-                ]
+                bin_count = bin_count[~self.isPassDisk(bin_count['bin'].to_numpy())]
 
             else:
                 bin_count = bin_count[~(bin_count['bin'] == self.PASS_BIN_HEAD)]
 
         return bin_count
 
-    def getDiskBins(self, bins: pd.DataFrame) -> Tuple[int, int, int]:
-        """ return the number of passed bins, failed bins and detcr bins."""
-        # Melt the bins DataFrame to get a single 'bin' column
-        bins = bins.melt(value_name='bin')
+    def getDiskBins(self, bins: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ return the masks of passed bins, failed bins and detcr bins, shaped like ``bins``."""
+        bins = np.asarray(bins)
 
-        bins_detcr = bins['bin'].str.startswith('D')
+        # Flatten bins to 1D array
+        bins_1d = bins.ravel()
 
-        bins_pass  = ((bins['bin'].str.len() == self.PASS_BIN_DISK_LEN) |
-                     (bins['bin'].str.startswith(self.PASS_BIN_DISK_MDWC) &
-                      ~bins['bin'].str[-3:].str.isdigit()))
+        bins_detcr = self.isDetcrDisk(bins_1d).reshape(bins.shape)
+
+        bins_pass  = self.isPassDisk(bins_1d).reshape(bins.shape)
 
         bins_fail = ~(bins_pass | bins_detcr)
 
-        return len(bins[bins_pass]), len(bins[bins_fail]), len(bins[bins_detcr])
+        return bins_pass, bins_fail, bins_detcr
 
     def getRccSummary(self, data: pd.DataFrame) -> pd.DataFrame:
 
@@ -120,36 +271,49 @@ class Data:
 
         return rcc_summary
 
-    def getYieldSummary(self, packs: pd.DataFrame) -> pd.DataFrame:
-
-        yields = pd.DataFrame(
-            columns=['tester', 'type', 'disk_pass', 'disk_fail', 'disks_fail_from_C', 'pack',
-                     'yield %']
-        )
-
-        testers = packs['tester'].unique()
-        for tester in testers:
-
-            tester_packs = packs[packs['tester'] == tester]
-            tester_disks = tester_packs[self.disks]
-
-            tester_type = 'mdsw' if 'mdsw' in tester_packs['profile'].iloc[0] else 'mdwc'
-
-            disks_pass, disks_fail, disks_detcr = self.getDiskBins(tester_disks)
-
-            n_packs = int((disks_pass + disks_fail + disks_detcr) / 24)
-
+    def getYieldSummary(
+        self,
+        packs: pd.DataFrame,
+        disks: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
+
+        if disks is None:
+            disks = packs[self.disks].to_numpy()
+
+        # Classify every disk of every pack once, then count the bins of each pack.
+        disks_pass, disks_fail, disks_detcr = self.getDiskBins(disks)
+
+        pack_bins = pd.DataFrame({
+            'tester'           : packs['tester'].array,
+            'disk_pass'        : disks_pass.sum(axis=1),
+            'disk_fail'        : disks_fail.sum(axis=1),
+            'disks_fail_from_C': disks_detcr.sum(axis=1),
+        })
+
+        bin_counts = pack_bins.groupby('tester', observed=True).sum()
+
+        # The tester type comes from the profile of the first pack of each tester.
+        profiles = packs[['tester', 'profile']].drop_duplicates('tester')
+        profiles = profiles.set_index('tester')['profile'].reindex(bin_counts.index)
+
+        tester_pass  = bin_counts['disk_pass'].to_numpy()
+        tester_fail  = bin_counts['disk_fail'].to_numpy()
+        tester_detcr = bin_counts['disks_fail_from_C'].to_numpy()
+
+        # Build the summary table in one go from the per-tester columns.
+        yields = pd.DataFrame({
+            'tester'           : bin_counts.index,
+            'type'             : np.where(profiles.str.contains('mdsw', na=False), 'mdsw', 'mdwc'),
+            'disk_pass'        : tester_pass,
+            'disk_fail'        : tester_fail,
+            'disks_fail_from_C': tester_detcr,
+            'pack'             : (tester_pass + tester_fail + tester_detcr) // self.n_disks,
             # mdsw yield calculation excludes disks_detcr
-            tester_yield = round(disks_pass * 100 / (disks_pass + disks_fail), 2)
-
-            yield_summary = pd.DataFrame(
-                [[tester, tester_type, disks_pass, disks_fail, disks_detcr, n_packs, tester_yield]],
-                columns = yields.columns
-            )
-
-            yields = pd.concat([yields, yield_summary])
+            'yield %'          : np.round(tester_pass * 100 / (tester_pass + tester_fail), 2),
+        })
 
-        yields = yields.sort_values('tester')
+        # ``observed=True`` keeps the testers in order of appearance, so sort them back.
+        yields = yields.sort_values('tester', ignore_index=True)
 
         return yields
 
@@ -162,29 +326,38 @@ class Data:
 
         packs = self.getPacksData(data_path, n_hours)
 
+        # Sort the packs from the latest once here, so the pack table does not have to sort them
+        # again on every tester click.
+        packs = packs.sort_values('date_time', ascending=False, ignore_index=True, kind='mergesort')
+
         filtered_pack_data = packs[
             ['pack_num', 'MX', 'tester', 'date_time', 'hsa_num', 'hub_sn', 'pack_aft_reboot',
              'n_head_cal', 'rcc', 'rcc_message'] + self.disks + self.heads
         ]
 
-        # Exclude ``data_time`` column before exporting packs information.
-        export_packs = packs.drop(columns=['date_time'])
+        # Select the bin columns once and work on the plain arrays from here on.
+        disks = packs[self.disks].to_numpy()
 
         rcc_summary   = self.getRccSummary(packs)
-        yield_summary = self.getYieldSummary(packs)
+        yield_summary = self.getYieldSummary(packs, disks)
 
-        head_bins = self.getBinCount(packs[self.heads], include_pass_bin=False)
-        disk_bins = self.getBinCount(packs[self.disks], include_pass_bin=False)
+        # The export sheets are only needed when an export is requested.
+        if export_path:
 
-        export_data = {
-            'data'           : export_packs,
-            'yield'          : yield_summary,
-            'rcc_summary'    : rcc_summary,
-            'head_bins_count': head_bins,
-            'disk_bins_count': disk_bins,
-        }
+            heads = packs[self.heads].to_numpy()
+
+            head_bins = self.getBinCount(heads, include_pass_bin=False)
+            disk_bins = self.getBinCount(disks, include_pass_bin=False)
+
+            export_data = {
+                # Exclude ``data_time`` column before exporting packs information.
+                'data'           : packs.drop(columns=['date_time']),
+                'yield'          : yield_summary,
+                'rcc_summary'    : rcc_summary,
+                'head_bins_count': head_bins,
+                'disk_bins_count': disk_bins,
+            }
 
-        if export_path:
             self.exportData(export_data, export_path)
 
         # fileter yield summary for yield table
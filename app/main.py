@@ -24,13 +24,46 @@ Copyright (C) Seagate Technology LLC, 2025. All rights reserved.
 from   app.data import Data
 import app.util as util
 import os
-from   PyQt5.QtGui import QIcon
+from   PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from   PyQt5.QtGui import QCloseEvent, QIcon
 from   PyQt5.QtWidgets import (QApplication, QWidget, QTableWidgetItem, QVBoxLayout, QMessageBox,
                                QHBoxLayout, QPushButton, QTableWidget, QLineEdit)
 import sys
 
 import pandas as pd
-from   typing import Optional, Tuple
+from   typing import Callable, Optional, Tuple
+
+class DataJobSignals(QObject):
+
+    finished = pyqtSignal(object, object, object)
+    failed   = pyqtSignal(str)
+
+class DataJob(QRunnable):
+    """Retrieve data with ``Data.getData`` in a thread pool and emit the result."""
+
+    def __init__(self, data: Data, data_path: str, export_path: Optional[str], n_hours: float):
+        super().__init__()
+
+        self.data        = data
+        self.data_path   = data_path
+        self.export_path = export_path
+        self.n_hours     = n_hours
+        self.signals     = DataJobSignals()
+
+    def run(self) -> None:
+
+        try:
+            packs, yield_data, rcc = self.data.getData(
+                data_path   = self.data_path,
+                export_path = self.export_path,
+                n_hours     = self.n_hours
+            )
+
+        except Exception as err:
+            self.signals.failed.emit(str(err))
+
+        else:
+            self.signals.finished.emit(packs, yield_data, rcc)
 
 class TestersTracker(QWidget):
 
@@ -43,8 +76,14 @@ class TestersTracker(QWidget):
         self.error         = None
         self.export_path   = None
         self.n_hours       = 120
+        self.refreshing    = False
         self.timer         = util.getTimer(self.refresh)
 
+        # Data is retrieved off the GUI thread, one job at a time so the jobs do not share the
+        # ``Data`` cache concurrently and their results arrive in order.
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(1)
+
         # Set the window title, position and size, and assign a custom icon
         self.setWindowTitle('Testers Tracker')
         self.setGeometry(300, 200, 1200, 800)
@@ -73,6 +112,16 @@ class TestersTracker(QWidget):
             self.updateYieldTable(yield_data, packs)
             self.updateRccTable(rcc)
 
+            # Save the csv cache after the first load, later changes are saved on exit.
+            self.data.savePackCache()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Wait for a running data job and save the csv cache before closing the window."""
+        self.thread_pool.waitForDone()
+        self.data.savePackCache()
+
+        super().closeEvent(event)
+
     def createInputHourLayout(self) -> QHBoxLayout:
         """
         Creates and returns a horizontal layout for entering hours. Includes a label, a text field
@@ -116,6 +165,7 @@ class TestersTracker(QWidget):
         # create packs table
         pack_columns      = packs.columns.tolist()
         widget_table_pack = util.createTable(labels_column=pack_columns, height=300)
+        widget_table_pack.cellClicked.connect(self.openPackFile)
 
         # create rcc table
         rcc_columns      = rcc.columns.tolist()
@@ -164,31 +214,60 @@ class TestersTracker(QWidget):
         except IOError as e:
             QMessageBox.critical(self, "Error", f"Could not open file: {e}")
 
+    def openPackFile(self, row: int, col: int) -> None:
+        """Open the MET file of the pack whose pack number cell is clicked."""
+        if col == 0:
+            self.openFile(file=self.table_packs.item(row, col).text())
+
     def refresh(self) -> None:
+        """Retrieve data in the background and update the yield and rcc tables when it is done."""
+        # Skip this round if the previous refresh is still running.
+        if self.refreshing:
+            return
 
-        try:
-            util.enableButton(self.button_export, enable=True)
+        self.refreshing = True
 
-            packs, yield_data, rcc = self.data.getData(
-                data_path=self.data_path,
-                export_path=self.export_path,
-                n_hours=self.n_hours
-            )
-    
-            self.updateYieldTable(yield_data, packs)
-            self.updateRccTable(rcc)
-    
-            self.export_path = None
-    
-            util.enableButton(self.button_submit, enable=True)
+        util.enableButton(self.button_export, enable=True)
 
-        except Exception as err:
+        self.startDataJob(self.onRefreshed)
 
-            self.error = str(err)
+        self.export_path = None
 
-            QMessageBox.information(self, "Warning from Testers Tracker", self.error)
+    def onRefreshed(
+        self,
+        packs:      pd.DataFrame,
+        yield_data: pd.DataFrame,
+        rcc:        pd.DataFrame
+    ) -> None:
 
-            QApplication.exit()
+        self.refreshing = False
+
+        self.updateYieldTable(yield_data, packs)
+        self.updateRccTable(rcc)
+
+        util.enableButton(self.button_submit, enable=True)
+
+    def onDataJobFailed(self, error: str) -> None:
+
+        self.error = error
+
+        QMessageBox.information(self, "Warning from Testers Tracker", self.error)
+
+        QApplication.exit()
+
+    def startDataJob(self, on_finished: Callable) -> None:
+        """Run ``Data.getData`` off the GUI thread and pass its result to ``on_finished``."""
+        job = DataJob(
+            data        = self.data,
+            data_path   = self.data_path,
+            export_path = self.export_path,
+            n_hours     = self.n_hours
+        )
+
+        job.signals.finished.connect(on_finished)
+        job.signals.failed.connect(self.onDataJobFailed)
+
+        self.thread_pool.start(job)
 
     def runWindow(self) -> str:
 
@@ -202,11 +281,14 @@ class TestersTracker(QWidget):
         """Retrieve and update data from now to the hours entered in the text field"""
         self.n_hours = float(hours_text_field.text())
 
-        packs, yield_data,  rcc = self.data.getData(
-            data_path   = self.data_path,
-            export_path = self.export_path,
-            n_hours     = self.n_hours
-        )
+        self.startDataJob(self.onDataUpdated)
+
+    def onDataUpdated(
+        self,
+        packs:      pd.DataFrame,
+        yield_data: pd.DataFrame,
+        rcc:        pd.DataFrame
+    ) -> None:
 
         self.updateYieldTable(yield_data, packs)
         self.updatePackData(packs)
@@ -223,24 +305,26 @@ class TestersTracker(QWidget):
         if tester:
             data = data[data['tester'] == tester]
 
-        data = data.sort_values('date_time', ascending=False)
-
         n_rows, n_cols = data.shape
         self.table_packs.setRowCount(n_rows)
         self.table_packs.setColumnCount(n_cols)
 
+        # Convert all the cells to text at once
+        items = data.astype(str).to_numpy()
+
+        # Hold repaints and signals until the whole table is filled. The MET file of a pack is
+        # opened from ``openPackFile`` when its pack number cell is clicked.
+        self.table_packs.setUpdatesEnabled(False)
+        self.table_packs.blockSignals(True)
+
         for row in range(n_rows):
             for col in range(n_cols):
-                item = str(data.iat[row, col])
-                self.table_packs.setItem(row, col, QTableWidgetItem(item))
-                self.table_packs.resizeColumnToContents(col)
+                self.table_packs.setItem(row, col, QTableWidgetItem(items[row, col]))
 
-                if col == 0:
-                    button = util.createPushButton(
-                        name=item,
-                        func=lambda checked, filename=item: self.openFile(file=filename), font=10
-                    )
-                    self.table_packs.setCellWidget(row, col, button)
+        self.table_packs.resizeColumnsToContents()
+
+        self.table_packs.blockSignals(False)
+        self.table_packs.setUpdatesEnabled(True)
 
     def updateRccTable(self, data: pd.DataFrame) -> None:
 
@@ -251,11 +335,18 @@ class TestersTracker(QWidget):
         self.table_rcc.setRowCount(n_rows)
         self.table_rcc.setColumnCount(n_cols)
 
+        items = data.to_numpy(dtype=object)
+
+        self.table_rcc.setUpdatesEnabled(False)
+
         for row in range(n_rows):
             for col in range(n_cols):
-                item_text = str(data.iat[row, col])
+                item_text = str(items[row, col])
                 self.table_rcc.setItem(row, col, QTableWidgetItem(item_text))
-                self.table_rcc.resizeColumnToContents(col)
+
+        self.table_rcc.resizeColumnsToContents()
+
+        self.table_rcc.setUpdatesEnabled(True)
 
     def updateYieldTable(self, data: pd.DataFrame, pack_data:pd.DataFrame) -> QTableWidget:
 
@@ -268,6 +359,8 @@ class TestersTracker(QWidget):
         self.table_yield.setColumnCount(len(testers))
         self.table_yield.setHorizontalHeaderLabels(testers)
 
+        self.table_yield.setUpdatesEnabled(False)
+
         for row, label in enumerate(types_yield):
             for col, tester in enumerate(testers):
 
@@ -275,7 +368,6 @@ class TestersTracker(QWidget):
                 name_label = str(name)
 
                 self.table_yield.setItem(row, col, QTableWidgetItem(name_label))
-                self.table_yield.resizeColumnToContents(col)
 
                 if not isinstance(name, str):
 
@@ -295,6 +387,10 @@ class TestersTracker(QWidget):
 
                     self.table_yield.setCellWidget(row, col, button)
 
+        self.table_yield.resizeColumnsToContents()
+
+        self.table_yield.setUpdatesEnabled(True)
+
         return self.table_yield
 
 if __name__ == "__main__":